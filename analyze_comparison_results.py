@@ -1,21 +1,167 @@
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend: plots are only saved to files
 import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
+import glob
+import hashlib
 import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv  # Optional: multithreaded CSV parsing, used when installed
+except ImportError:
+    pa_csv = None
 
 # --- Configuration ---
 CSV_FILENAME = '/Users/ADMIN/Desktop/Cloudsim/cloudsim-3.0.3/cloudsim-3.0.3/compare_sla_results.csv'
 OUTPUT_DIR = 'sla_pso_plots'  # Directory to save generated plots
+CSV_CHUNK_ROWS = 1_000_000  # Rows parsed per read_csv chunk; bounds peak memory on large CSVs
+CSV_BLOCK_BYTES = 64 * 1024 * 1024  # Bytes parsed per block by the pyarrow reader; bounds peak memory likewise
+PLOT_DPI = int(os.environ.get('PLOT_DPI', '96'))  # Resolution of saved plots; e.g. PLOT_DPI=72 for quicker debug runs
 
 # Ensure output directory exists
 if not os.path.exists(OUTPUT_DIR):
     os.makedirs(OUTPUT_DIR)
     print(f"Created output directory: {OUTPUT_DIR}")
 
+# Numeric columns used by the analyses below; only these and 'Algorithm' are loaded
+numeric_cols = ['NumVMs', 'NumHosts', 'Landscape', 'StdDev_Host_CPU_Util(%)']
+
+
+def _filter_chunks(chunks, numeric_cols, algorithm):
+    """Keeps only the rows for `algorithm` from each CSV chunk; also collects every raw algorithm name seen."""
+    parts = []
+    algorithms_found = {}  # dict rather than set to keep the order of first appearance
+    for chunk in chunks:
+        # Strip whitespace from column names
+        chunk.columns = chunk.columns.str.strip()
+        # 'Algorithm' is read as a categorical, so whitespace is stripped from its few distinct names
+        # rather than from every row, and the filter becomes an integer compare on the category codes
+        algorithm_names = chunk['Algorithm'].cat.categories
+        algorithms_found.update(dict.fromkeys(algorithm_names))
+        matching_codes = np.flatnonzero(algorithm_names.str.strip() == algorithm)
+        chunk = chunk.loc[chunk['Algorithm'].cat.codes.isin(matching_codes)]
+        # Every remaining row is `algorithm`; store it under its stripped name
+        chunk = chunk.assign(Algorithm=pd.Categorical.from_codes(np.zeros(len(chunk), dtype='int8'), categories=[algorithm]))
+        # Only the untyped fallback read leaves non-numeric columns behind
+        coerced_cols = {col: pd.to_numeric(chunk[col], errors='coerce') for col in numeric_cols
+                        if col in chunk.columns and not pd.api.types.is_numeric_dtype(chunk[col])}
+        parts.append(chunk.assign(**coerced_cols) if coerced_cols else chunk)
+    df = pd.concat(parts, ignore_index=True)
+    return df, list(algorithms_found)
+
+
+def _arrow_chunks(csv_path, column_types):
+    """Streams the CSV through pyarrow's multithreaded reader, yielding each block as a DataFrame chunk."""
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+        convert_options=pa_csv.ConvertOptions(include_columns=list(column_types), column_types=column_types,
+                                              strings_can_be_null=True),
+    )
+    has_rows = False
+    for batch in reader:
+        has_rows = True
+        yield batch.to_pandas()
+    if not has_rows:
+        # Header-only CSV; still yield one (empty) chunk with the right columns
+        yield reader.schema.empty_table().to_pandas()
+
+
+def load_results(csv_path, numeric_cols, algorithm):
+    """Loads the rows for `algorithm` from the comparison CSV, with the 'Algorithm' column and the given numeric columns.
+
+    The CSV is parsed in chunks (CSV_BLOCK_BYTES blocks with pyarrow, else CSV_CHUNK_ROWS rows) and each
+    chunk is filtered before the next is read, so peak memory follows the chunk size rather than the file
+    size. Returns the filtered frame and the list of raw algorithm names found in the file.
+    """
+    # Read the header first so the column dtypes can be declared up front; this lets
+    # read_csv parse each column straight into its final type instead of inferring
+    # types and re-casting every column afterwards.
+    raw_names = {col.strip(): col for col in pd.read_csv(csv_path, sep=',', nrows=0).columns}
+    if 'Algorithm' not in raw_names:
+        raise ValueError("'Algorithm' column not found in the CSV.")
+    column_dtypes = {raw_names[col]: 'float32' for col in numeric_cols if col in raw_names}
+    column_dtypes[raw_names['Algorithm']] = 'category'
+    try:
+        if pa_csv is not None:
+            # Arrow dictionary-encoded strings arrive in pandas as categoricals
+            column_types = {col: pa.dictionary(pa.int32(), pa.string()) if dtype == 'category' else pa.float32()
+                            for col, dtype in column_dtypes.items()}
+            return _filter_chunks(_arrow_chunks(csv_path, column_types), numeric_cols, algorithm)
+        chunks = pd.read_csv(csv_path, sep=',', usecols=list(column_dtypes), dtype=column_dtypes,
+                             chunksize=CSV_CHUNK_ROWS, engine='c')
+        return _filter_chunks(chunks, numeric_cols, algorithm)
+    except ValueError:
+        # A numeric column holds a non-numeric value; parse untyped and coerce per chunk instead.
+        chunks = pd.read_csv(csv_path, sep=',', usecols=list(column_dtypes), dtype={raw_names['Algorithm']: 'category'},
+                             chunksize=CSV_CHUNK_ROWS, engine='c')
+        return _filter_chunks(chunks, numeric_cols, algorithm)
+
+
+def results_cache_path(csv_path, numeric_cols, algorithm):
+    """Returns the parquet sidecar path for the CSV's current mtime/size and the requested algorithm and columns."""
+    stat = os.stat(csv_path)
+    selection_key = zlib.crc32(','.join([algorithm] + numeric_cols).encode())
+    key = f"{stat.st_mtime:.0f}_{stat.st_size}_{selection_key:08x}"
+    return os.path.join(os.path.dirname(csv_path), f".{os.path.basename(csv_path)}.cache_{key}.parquet")
+
+
+def load_results_cached(csv_path, numeric_cols, algorithm):
+    """Like load_results(), but reuses a parquet sidecar of the filtered frame while the CSV is unchanged.
+
+    The algorithm names are only known after parsing the CSV, so None is returned for them on a cache hit.
+    """
+    cache_path = results_cache_path(csv_path, numeric_cols, algorithm)
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path)
+            print(f"Using cached parse: {cache_path}")
+            return df, None
+        except Exception as e:
+            # Unreadable sidecar (e.g. left truncated by an interrupted run); drop it and parse the CSV again
+            print(f"Ignoring unreadable cache {cache_path}: {e}")
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+
+    df, algorithms_found = load_results(csv_path, numeric_cols, algorithm)
+    if df.empty:
+        # Nothing worth caching; parsing again next run also prints the algorithm names again
+        return df, algorithms_found
+    stale_pattern = os.path.join(glob.escape(os.path.dirname(csv_path)), f".{glob.escape(os.path.basename(csv_path))}.cache_*.parquet*")
+    # Written under a temporary name and renamed into place, so an interrupted write never
+    # leaves a truncated sidecar at the path a later run would read
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        # Sidecars for earlier versions of the CSV can never be hit again; temporaries are from interrupted runs
+        for stale_path in glob.glob(stale_pattern):
+            os.remove(stale_path)
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except (ImportError, OSError) as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        # No parquet engine installed or the CSV directory is read-only; just parse again next run
+        print(f"Could not cache the parsed CSV: {e}")
+    return df, algorithms_found
+
+
+# --- FIX: Change the algorithm name here if the printed list shows a different value ---
+# Names are compared after stripping whitespace, so ['SLA-PSO '] still matches 'SLA-PSO'.
+# If it's ['SLA_PSO'], you would use 'SLA_PSO'
+target_algorithm = 'SLA-PSO'
+
 # --- Load Data ---
+# Only the rows for target_algorithm are kept, filtered while the CSV is read
 try:
-    df = pd.read_csv(CSV_FILENAME, sep=',')
+    sla_pso_df, algorithms_found = load_results_cached(CSV_FILENAME, numeric_cols, target_algorithm)
     print(f"Successfully loaded '{CSV_FILENAME}'.")
 except FileNotFoundError:
     print(f"Error: '{CSV_FILENAME}' not found. Please ensure the CSV file is in the correct directory.")
@@ -25,41 +171,41 @@ except Exception as e:
     exit()
 
 # --- Data Cleaning and Preparation ---
-# Strip whitespace from column names
-df.columns = df.columns.str.strip()
-
 # --- NEW: Print all unique algorithm names to help with debugging ---
-print("\nUnique algorithms found in the 'Algorithm' column:")
-if 'Algorithm' in df.columns:
-    print(df['Algorithm'].unique())
-else:
-    print("Error: 'Algorithm' column not found in the CSV.")
-    exit()
+if algorithms_found is not None:
+    print("\nUnique algorithms found in the 'Algorithm' column:")
+    print(algorithms_found)
+
+# Drop rows with NaN values in critical columns
+sla_pso_df = sla_pso_df.dropna(subset=['NumVMs', 'NumHosts', 'Landscape', 'StdDev_Host_CPU_Util(%)'])
 
-# List of columns to convert to numeric
-numeric_cols = [
-    'NumVMs', 'NumHosts', 'Landscape', 'ScalingFactor', 'SLA_Violations',
-    'Failed_Allocations', 'Avg_ResponseTime', 'Avg_TurnaroundTime', 'Makespan',
-    'Throughput', 'Avg_Host_CPU_Util(%)', 'StdDev_Host_CPU_Util(%)', 'Avg_QoS_Index'
-]
+# With the NaN rows gone, downcast: the configuration columns are small integers and the metric
+# fits float32, halving the bytes each groupby/mean pass below has to read. A configuration column
+# holding a fractional value stays float32 so the value is not truncated into a real configuration
+# (e.g. Landscape=4.5 must still be labelled 'Unknown' below, not counted as Landscape 4).
+config_dtypes = {col: 'int32' for col in ['NumVMs', 'NumHosts', 'Landscape'] if (sla_pso_df[col] % 1 == 0).all()}
+sla_pso_df = sla_pso_df.astype({**config_dtypes, 'StdDev_Host_CPU_Util(%)': 'float32'})
 
-for col in numeric_cols:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+# Nothing to analyze; stop here rather than have every analysis below report no data
+if sla_pso_df.empty:
+    print(f"\nNo data found for '{target_algorithm}'. Check the algorithm names printed above and update target_algorithm.")
+    exit()
 
-# Drop rows with NaN values in critical columns and filter for SLA-PSO only
-df.dropna(subset=['Algorithm', 'NumVMs', 'NumHosts', 'Landscape', 'StdDev_Host_CPU_Util(%)'], inplace=True)
+# Convert 'Landscape' to descriptive names for plotting, as a categorical whose category
+# order is the consistent plotting order for landscape types
+landscape_order = ['Homogeneous Small', 'Homogeneous Medium', 'Homogeneous Large', 'Heterogeneous']
+landscape_map = {code: name for code, name in enumerate(landscape_order, start=1)}
 
-# --- FIX: Change the algorithm name here if the printed list shows a different value ---
-# For example, if the output is ['SLA-PSO '], you would use 'SLA-PSO '
-# Or if it's ['SLA_PSO'], you would use 'SLA_PSO'
-target_algorithm = 'SLA-PSO'
-sla_pso_df = df[df['Algorithm'].str.strip() == target_algorithm].copy()
+def describe_landscapes(landscape):
+    """Maps numeric Landscape codes to their descriptive names as a categorical in landscape_order, plus 'Unknown'."""
+    # Landscapes 1-4 become category codes 0-3 by plain arithmetic; anything else becomes 'Unknown'
+    landscape_codes = landscape.to_numpy(dtype='float64') - 1
+    known = np.isin(landscape_codes, np.arange(len(landscape_order)))
+    landscape_codes = np.where(known, landscape_codes, len(landscape_order)).astype('int8')
+    return pd.Categorical.from_codes(landscape_codes, categories=landscape_order + ['Unknown'])
 
-# Convert 'Landscape' to descriptive names for plotting
-landscape_map = {1: 'Homogeneous Small', 2: 'Homogeneous Medium', 3: 'Homogeneous Large', 4: 'Heterogeneous'}
 if 'Landscape' in sla_pso_df.columns:
-    sla_pso_df['Landscape_Desc'] = sla_pso_df['Landscape'].map(landscape_map).fillna('Unknown')
+    sla_pso_df['Landscape_Desc'] = describe_landscapes(sla_pso_df['Landscape'])
 
 print(f"\nData after cleaning and filtering for '{target_algorithm}'. Shape: {sla_pso_df.shape}")
 print("Unique NumVMs:", sla_pso_df['NumVMs'].unique())
@@ -67,119 +213,210 @@ print("Unique NumHosts:", sla_pso_df['NumHosts'].unique())
 print("Unique Landscape_Desc:", sla_pso_df['Landscape_Desc'].unique())
 
 
-# --- Plotting Functions for single algorithm plots (unchanged) ---
+_print_lock = threading.Lock()
 
-def plot_line_single(data, x_axis, y_axis, title, filename_prefix, fixed_params_desc):
+def log(message):
+    """print() for code run by the concurrent analyses below; the lock keeps their lines from interleaving."""
+    with _print_lock:
+        print(message)
+
+
+# --- Plotting Functions for single algorithm plots ---
+# Each function draws onto the Axes passed in, clearing it first, so consecutive plots reuse one Figure.
+
+def _slug(column):
+    """Turns a column name into a filename-safe fragment, e.g. 'StdDev_Host_CPU_Util(%)' -> 'StdDev_Host_CPU_Utilpct'."""
+    return column.replace('(', '').replace(')', '').replace('%', 'pct')
+
+def _pretty(column):
+    """Turns a column name into an axis label, e.g. 'StdDev_Host_CPU_Util(%)' -> 'StdDev Host CPU Util%'."""
+    return column.replace('_', ' ').replace('(%)', '%')
+
+# Hash of this script's source, so editing any plotting code invalidates the plot hashes below
+with open(__file__, 'rb') as script_file:
+    _SCRIPT_HASH = hashlib.sha1(script_file.read()).hexdigest()
+
+def _plot_hash(data, *plot_args):
+    """Hashes a plot's input data, its arguments and this script, i.e. everything that determines the rendered PNG."""
+    plot_hash = hashlib.sha1(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    plot_hash.update(repr((data.columns.tolist(), plot_args, PLOT_DPI, _SCRIPT_HASH)).encode())
+    return plot_hash.hexdigest()
+
+def _plot_is_current(plot_path, plot_hash):
+    """Returns True if plot_path exists and was rendered from inputs with the same hash."""
+    try:
+        with open(plot_path + '.hash') as hash_file:
+            return hash_file.read() == plot_hash and os.path.exists(plot_path)
+    except OSError:
+        return False
+
+def _record_plot_hash(plot_path, plot_hash):
+    """Stores the input hash next to a freshly saved plot for _plot_is_current() on later runs."""
+    with open(plot_path + '.hash', 'w') as hash_file:
+        hash_file.write(plot_hash)
+
+def _skip_unchanged_plot(plot_path, plot_hash):
+    """Returns True (and logs the skip) if plot_path is already rendered from inputs with this hash."""
+    if _plot_is_current(plot_path, plot_hash):
+        log(f"Plot unchanged, skipped: {plot_path}")
+        return True
+    return False
+
+def _save_plot(ax, plot_path, plot_hash, fixed_params_desc):
+    """Adds the fixed-parameters caption below the Axes, saves its Figure and records the plot's input hash."""
+    # Placed on the Axes (below the x label) so constrained layout makes room for it
+    ax.text(0.5, -0.11, fixed_params_desc, transform=ax.transAxes, ha="center", va="top", fontsize=9,
+            bbox={"facecolor":"white", "alpha":0.5, "pad":5})
+    ax.figure.savefig(plot_path, dpi=PLOT_DPI, format='png')
+    _record_plot_hash(plot_path, plot_hash)
+    log(f"Plot saved: {plot_path}")
+
+def plot_line_single(ax, data, x_axis, y_axis, title, filename_prefix, fixed_params_desc):
     """Generates and saves a line plot for a single algorithm."""
-    plt.figure(figsize=(10, 6))
-    sns.lineplot(data=data, x=x_axis, y=y_axis, marker='o', color='dodgerblue')
-    plt.title(title)
-    plt.xlabel(x_axis.replace('_', ' '))
-    plt.ylabel(y_axis.replace('_', ' ').replace('(%)', '%'))
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.figtext(0.5, -0.05, fixed_params_desc, ha="center", fontsize=9, bbox={"facecolor":"white", "alpha":0.5, "pad":5})
-    plt.tight_layout(rect=[0, 0.05, 1, 1])
-    plot_path = os.path.join(OUTPUT_DIR, f"{filename_prefix}_{y_axis.replace('(', '').replace(')', '').replace('%', 'pct')}_line.png")
-    plt.savefig(plot_path)
-    print(f"Plot saved: {plot_path}")
-    plt.close()
-
-def plot_bar_single(data, x_axis, y_axis, title, filename_prefix, fixed_params_desc):
+    plot_path = os.path.join(OUTPUT_DIR, f"{filename_prefix}_{_slug(y_axis)}_line.png")
+    plot_hash = _plot_hash(data, x_axis, y_axis, title, fixed_params_desc)
+    if _skip_unchanged_plot(plot_path, plot_hash):
+        return
+    ax.clear()
+    ax.plot(data[x_axis].to_numpy(), data[y_axis].to_numpy(), marker='o', color='dodgerblue')
+    ax.set_title(title)
+    ax.set_xlabel(_pretty(x_axis))
+    ax.set_ylabel(_pretty(y_axis))
+    ax.grid(True, linestyle='--', alpha=0.7)
+    _save_plot(ax, plot_path, plot_hash, fixed_params_desc)
+
+def plot_bar_single(ax, data, x_axis, y_axis, title, filename_prefix, fixed_params_desc):
     """Generates and saves a bar chart for a single algorithm."""
-    plt.figure(figsize=(10, 6))
-    sns.barplot(data=data, x=x_axis, y=y_axis, palette=['seagreen'])
-    plt.title(title)
-    plt.xlabel(x_axis.replace('_', ' '))
-    plt.ylabel(y_axis.replace('_', ' ').replace('(%)', '%'))
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.figtext(0.5, -0.05, fixed_params_desc, ha="center", fontsize=9, bbox={"facecolor":"white", "alpha":0.5, "pad":5})
-    plt.tight_layout(rect=[0, 0.05, 1, 1])
-    plot_path = os.path.join(OUTPUT_DIR, f"{filename_prefix}_{y_axis.replace('(', '').replace(')', '').replace('%', 'pct')}_bar.png")
-    plt.savefig(plot_path)
-    print(f"Plot saved: {plot_path}")
-    plt.close()
-
-def plot_boxplot_single(data, x_axis, y_axis, title, filename_prefix, fixed_params_desc):
+    plot_path = os.path.join(OUTPUT_DIR, f"{filename_prefix}_{_slug(y_axis)}_bar.png")
+    plot_hash = _plot_hash(data, x_axis, y_axis, title, fixed_params_desc)
+    if _skip_unchanged_plot(plot_path, plot_hash):
+        return
+    ax.clear()
+    # Bar height is the mean per category, with a 95% confidence interval (normal approximation) as the error bar
+    stats = data.groupby(x_axis, observed=True)[y_axis].agg(['mean', 'sem'])
+    ax.bar(stats.index.astype(str), stats['mean'].to_numpy(), yerr=1.96 * stats['sem'].to_numpy(),
+           color='seagreen', ecolor='0.26')
+    ax.set_title(title)
+    ax.set_xlabel(_pretty(x_axis))
+    ax.set_ylabel(_pretty(y_axis))
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    _save_plot(ax, plot_path, plot_hash, fixed_params_desc)
+
+def plot_boxplot_single(ax, data, x_axis, y_axis, title, filename_prefix, fixed_params_desc):
     """Generates and saves a box plot for a single algorithm."""
-    plt.figure(figsize=(10, 6))
-    sns.boxplot(data=data, x=x_axis, y=y_axis, palette=['gold'])
-    sns.stripplot(data=data, x=x_axis, y=y_axis, color='black', size=4, jitter=True, alpha=0.6)
-    plt.title(title)
-    plt.xlabel(x_axis.replace('_', ' '))
-    plt.ylabel(y_axis.replace('_', ' ').replace('(%)', '%'))
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.figtext(0.5, -0.05, fixed_params_desc, ha="center", fontsize=9, bbox={"facecolor":"white", "alpha":0.5, "pad":5})
-    plt.tight_layout(rect=[0, 0.05, 1, 1])
-    plot_path = os.path.join(OUTPUT_DIR, f"{filename_prefix}_{y_axis.replace('(', '').replace(')', '').replace('%', 'pct')}_boxplot.png")
-    plt.savefig(plot_path)
-    print(f"Plot saved: {plot_path}")
-    plt.close()
+    plot_path = os.path.join(OUTPUT_DIR, f"{filename_prefix}_{_slug(y_axis)}_boxplot.png")
+    plot_hash = _plot_hash(data, x_axis, y_axis, title, fixed_params_desc)
+    if _skip_unchanged_plot(plot_path, plot_hash):
+        return
+    ax.clear()
+    groups = data.groupby(x_axis, observed=True)[y_axis]
+    labels = [str(label) for label, _ in groups]
+    values = [group.to_numpy() for _, group in groups]
+    positions = np.arange(len(values))
+    ax.boxplot(values, positions=positions, widths=0.8, patch_artist=True,
+               boxprops={'facecolor': 'gold'}, medianprops={'color': 'black'})
+    # Overlay the individual runs, jittered horizontally so overlapping points stay visible
+    rng = np.random.default_rng()
+    for position, group_values in zip(positions, values):
+        jitter = rng.uniform(-0.1, 0.1, size=len(group_values))
+        ax.scatter(position + jitter, group_values, color='black', s=16, alpha=0.6, zorder=3)
+    ax.set_xticks(positions)
+    ax.set_xticklabels(labels)
+    ax.set_title(title)
+    ax.set_xlabel(_pretty(x_axis))
+    ax.set_ylabel(_pretty(y_axis))
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    _save_plot(ax, plot_path, plot_hash, fixed_params_desc)
+
+
+def slice_grouped(grouped, fixed_levels, value_name):
+    """Selects the groups matching the fixed index levels and returns them as a flat DataFrame (empty if none match)."""
+    try:
+        return grouped.xs(tuple(fixed_levels.values()), level=tuple(fixed_levels)).reset_index(name=value_name)
+    except KeyError:
+        return pd.DataFrame(columns=[value_name])
 
 
 # --- Analysis and Plotting for SLA-PSO only ---
 
-# --- 1. VM Scaling Analysis (Fixed Hosts=5, Landscape=4) ---
-fixed_hosts_vm_scaling = 5
-fixed_landscape_vm_scaling = 4
-vm_scaling_data = sla_pso_df[(sla_pso_df['NumHosts'] == fixed_hosts_vm_scaling) & (sla_pso_df['Landscape'] == fixed_landscape_vm_scaling)].copy()
+# Average StdDev of host CPU utilization per configuration, aggregated in a single
+# groupby pass and then sliced by each analysis below (a pivot_table over the same
+# keys is equivalent and benchmarks no faster)
+stddev_by_config = sla_pso_df.groupby(['NumHosts', 'NumVMs', 'Landscape'], observed=True)['StdDev_Host_CPU_Util(%)'].mean()
 
-if not vm_scaling_data.empty:
-    vm_scaling_grouped = vm_scaling_data.groupby(['NumVMs']).agg(
-        Avg_StdDev_Host_CPU_Util_Pct=('StdDev_Host_CPU_Util(%)', 'mean')
-    ).reset_index()
+# --- 1. VM Scaling Analysis (Fixed Hosts=5, Landscape=4) ---
+def analyze_vm_scaling(ax):
+    fixed_hosts_vm_scaling = 5
+    fixed_landscape_vm_scaling = 4
+    vm_scaling_grouped = slice_grouped(stddev_by_config, {'NumHosts': fixed_hosts_vm_scaling, 'Landscape': fixed_landscape_vm_scaling},
+                                       'Avg_StdDev_Host_CPU_Util_Pct')
 
-    fixed_desc = f"Fixed: Hosts={fixed_hosts_vm_scaling}, Landscape={landscape_map.get(fixed_landscape_vm_scaling, 'Unknown')}"
-    plot_line_single(vm_scaling_grouped, 'NumVMs', 'Avg_StdDev_Host_CPU_Util_Pct',
-                     'SLA-PSO: Avg StdDev of Host CPU Utilization (%) vs. Number of VMs', 'sla_pso_vm_scaling_stddev_cpu_util', fixed_desc)
-else:
-    print(f"\nNo data found for {target_algorithm} VM Scaling (Hosts={fixed_hosts_vm_scaling}, Landscape={fixed_landscape_vm_scaling}).")
+    if not vm_scaling_grouped.empty:
+        fixed_desc = f"Fixed: Hosts={fixed_hosts_vm_scaling}, Landscape={landscape_map.get(fixed_landscape_vm_scaling, 'Unknown')}"
+        plot_line_single(ax, vm_scaling_grouped, 'NumVMs', 'Avg_StdDev_Host_CPU_Util_Pct',
+                         'SLA-PSO: Avg StdDev of Host CPU Utilization (%) vs. Number of VMs', 'sla_pso_vm_scaling_stddev_cpu_util', fixed_desc)
+    else:
+        log(f"\nNo data found for {target_algorithm} VM Scaling (Hosts={fixed_hosts_vm_scaling}, Landscape={fixed_landscape_vm_scaling}).")
 
 
 # --- 2. Host Scaling Analysis (Fixed VMs=30, Landscape=4) ---
-fixed_vms_host_scaling = 30
-fixed_landscape_host_scaling = 4
-host_scaling_data = sla_pso_df[(sla_pso_df['NumVMs'] == fixed_vms_host_scaling) & (sla_pso_df['Landscape'] == fixed_landscape_host_scaling)].copy()
+def analyze_host_scaling(ax):
+    fixed_vms_host_scaling = 30
+    fixed_landscape_host_scaling = 4
+    host_scaling_grouped = slice_grouped(stddev_by_config, {'NumVMs': fixed_vms_host_scaling, 'Landscape': fixed_landscape_host_scaling},
+                                         'Avg_StdDev_Host_CPU_Util_Pct')
 
-if not host_scaling_data.empty:
-    host_scaling_grouped = host_scaling_data.groupby(['NumHosts']).agg(
-        Avg_StdDev_Host_CPU_Util_Pct=('StdDev_Host_CPU_Util(%)', 'mean')
-    ).reset_index()
-
-    fixed_desc = f"Fixed: VMs={fixed_vms_host_scaling}, Landscape={landscape_map.get(fixed_landscape_host_scaling, 'Unknown')}"
-    plot_line_single(host_scaling_grouped, 'NumHosts', 'Avg_StdDev_Host_CPU_Util_Pct',
-                     'SLA-PSO: Avg StdDev of Host CPU Utilization (%) vs. Number of Hosts', 'sla_pso_host_scaling_stddev_cpu_util', fixed_desc)
-else:
-    print(f"\nNo data found for {target_algorithm} Host Scaling (VMs={fixed_vms_host_scaling}, Landscape={fixed_landscape_host_scaling}).")
+    if not host_scaling_grouped.empty:
+        fixed_desc = f"Fixed: VMs={fixed_vms_host_scaling}, Landscape={landscape_map.get(fixed_landscape_host_scaling, 'Unknown')}"
+        plot_line_single(ax, host_scaling_grouped, 'NumHosts', 'Avg_StdDev_Host_CPU_Util_Pct',
+                         'SLA-PSO: Avg StdDev of Host CPU Utilization (%) vs. Number of Hosts', 'sla_pso_host_scaling_stddev_cpu_util', fixed_desc)
+    else:
+        log(f"\nNo data found for {target_algorithm} Host Scaling (VMs={fixed_vms_host_scaling}, Landscape={fixed_landscape_host_scaling}).")
 
 
 # --- 3. Landscape Variation Analysis (Fixed VMs=30, Hosts=5) ---
-fixed_vms_landscape = 30
-fixed_hosts_landscape = 5
-landscape_variation_data = sla_pso_df[(sla_pso_df['NumVMs'] == fixed_vms_landscape) & (sla_pso_df['NumHosts'] == fixed_hosts_landscape)].copy()
-
-if not landscape_variation_data.empty:
-    # Ensure consistent order for landscape types on plots
-    landscape_order = ['Homogeneous Small', 'Homogeneous Medium', 'Homogeneous Large', 'Heterogeneous']
-    landscape_variation_data['Landscape_Desc'] = pd.Categorical(
-        landscape_variation_data['Landscape_Desc'],
-        categories=[l for l in landscape_order if l in landscape_variation_data['Landscape_Desc'].unique()],
-        ordered=True
-    )
-    landscape_variation_data = landscape_variation_data.sort_values('Landscape_Desc')
-
-    fixed_desc = f"Fixed: VMs={fixed_vms_landscape}, Hosts={fixed_hosts_landscape}"
-    
-    # Plotting the three requested chart types
-    plot_bar_single(landscape_variation_data, 'Landscape_Desc', 'StdDev_Host_CPU_Util(%)',
-                    'SLA-PSO: Avg StdDev of Host CPU Utilization (%) vs. Landscape Type', 'sla_pso_landscape_stddev_cpu_util', fixed_desc)
-    
-    plot_line_single(landscape_variation_data.groupby('Landscape_Desc', observed=False)['StdDev_Host_CPU_Util(%)'].mean().reset_index(),
-                     'Landscape_Desc', 'StdDev_Host_CPU_Util(%)',
-                     'SLA-PSO: Avg StdDev of Host CPU Utilization (%) vs. Landscape Type (Curve)', 'sla_pso_landscape_stddev_cpu_util_curve', fixed_desc)
-    
-    plot_boxplot_single(landscape_variation_data, 'Landscape_Desc', 'StdDev_Host_CPU_Util(%)',
-                        'SLA-PSO: StdDev of Host CPU Utilization (%) Distribution by Landscape Type', 'sla_pso_landscape_stddev_cpu_util_boxplot', fixed_desc)
-else:
-    print(f"\nNo data found for {target_algorithm} Landscape Variation (VMs={fixed_vms_landscape}, Hosts={fixed_hosts_landscape}).")
+def analyze_landscape_variation(ax):
+    fixed_vms_landscape = 30
+    fixed_hosts_landscape = 5
+    landscape_variation_data = sla_pso_df.loc[(sla_pso_df['NumVMs'] == fixed_vms_landscape) & (sla_pso_df['NumHosts'] == fixed_hosts_landscape)
+                                              & (sla_pso_df['Landscape_Desc'] != 'Unknown')]
+
+    if not landscape_variation_data.empty:
+        # No sorting or category pruning needed: the plot helpers group by Landscape_Desc with
+        # observed=True, which yields only the landscape types present, in landscape_order
+        fixed_desc = f"Fixed: VMs={fixed_vms_landscape}, Hosts={fixed_hosts_landscape}"
+
+        # Plotting the three requested chart types
+        plot_bar_single(ax, landscape_variation_data, 'Landscape_Desc', 'StdDev_Host_CPU_Util(%)',
+                        'SLA-PSO: Avg StdDev of Host CPU Utilization (%) vs. Landscape Type', 'sla_pso_landscape_stddev_cpu_util', fixed_desc)
+
+        # The per-landscape means are already in stddev_by_config; label them instead of grouping again
+        landscape_curve = slice_grouped(stddev_by_config, {'NumVMs': fixed_vms_landscape, 'NumHosts': fixed_hosts_landscape},
+                                        'StdDev_Host_CPU_Util(%)')
+        landscape_curve['Landscape_Desc'] = describe_landscapes(landscape_curve['Landscape'])
+        plot_line_single(ax, landscape_curve.loc[landscape_curve['Landscape_Desc'] != 'Unknown'], 'Landscape_Desc', 'StdDev_Host_CPU_Util(%)',
+                         'SLA-PSO: Avg StdDev of Host CPU Utilization (%) vs. Landscape Type (Curve)', 'sla_pso_landscape_stddev_cpu_util_curve', fixed_desc)
+
+        plot_boxplot_single(ax, landscape_variation_data, 'Landscape_Desc', 'StdDev_Host_CPU_Util(%)',
+                            'SLA-PSO: StdDev of Host CPU Utilization (%) Distribution by Landscape Type', 'sla_pso_landscape_stddev_cpu_util_boxplot', fixed_desc)
+    else:
+        log(f"\nNo data found for {target_algorithm} Landscape Variation (VMs={fixed_vms_landscape}, Hosts={fixed_hosts_landscape}).")
+
+
+# The three analyses share no state, so run them concurrently. Threads rather than processes:
+# a spawned worker process would re-run this whole script on import. Each analysis gets its own
+# Figure, created here on the main thread so pyplot itself is never called from a worker.
+analyses = [analyze_vm_scaling, analyze_host_scaling, analyze_landscape_variation]
+figures = [plt.subplots(figsize=(10, 6), layout='constrained') for _ in analyses]
+for fig, _ in figures:
+    # Extra padding so the caption's box, which constrained layout does not measure, stays inside the figure
+    fig.get_layout_engine().set(h_pad=0.1)
+with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+    futures = [executor.submit(analysis, ax) for analysis, (_, ax) in zip(analyses, figures)]
+    for future in futures:
+        future.result()  # Re-raise any error from the analysis
+
+for fig, _ in figures:
+    plt.close(fig)
 
 print("\nAnalysis complete. Check the 'sla_pso_plots' directory for generated graphs.")
\ No newline at end of file